@@ -1,31 +1,77 @@
-from flask import Flask, render_template, request, send_file, flash, redirect, url_for, jsonify
-import json
-import uuid
+from flask import Flask, Response, abort, render_template, request, send_file, flash, redirect, url_for, jsonify, g, session
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
+import orjson
 import os
+import hashlib
+import hmac
+import secrets
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import simpleSplit
 from dataclasses import dataclass, asdict
 from typing import Optional, List, Dict, Any
 import logging
-from functools import wraps
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def _options(self, pretty: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # orjson returns bytes; callers of dumps expect str
+        return orjson.dumps(obj, default=self.default, option=self._options(bool(kwargs.get('indent')))).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(pretty) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024  # 16KB max form data
+app.config['CERTIFICATE_FORM_MAX_LENGTH'] = 4 * 1024  # name + course only
 app.config['DATA_DIR'] = Path('data')
 app.config['STATIC_DIR'] = Path('static')
-app.config['CERTIFICATES_FILE'] = app.config['DATA_DIR'] / 'certificates.json'
+app.config['CERTIFICATES_FILE'] = app.config['DATA_DIR'] / 'certificates.json'  # legacy store, imported once
+app.config['DATABASE_FILE'] = app.config['DATA_DIR'] / 'certificates.db'
+app.config['JINJA_CACHE_DIR'] = app.config['DATA_DIR'] / 'jinja_cache'
 
 # Ensure directories exist
 app.config['DATA_DIR'].mkdir(exist_ok=True)
 app.config['STATIC_DIR'].mkdir(exist_ok=True)
+app.config['JINJA_CACHE_DIR'].mkdir(exist_ok=True)
+
+# Template mtimes are only re-checked in debug mode (Flask's default when
+# TEMPLATES_AUTO_RELOAD is unset); compiled bytecode is cached on disk
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(app.config['JINJA_CACHE_DIR']))
+
+# Keep admin sessions server-side in Redis when REDIS_URL is set; the cookie
+# then only carries a session id. Without it Flask's signed cookie is used.
+if os.environ.get('REDIS_URL'):
+    import redis
+    from flask_session import Session
+    
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis.from_url(os.environ['REDIS_URL'])
+    Session(app)
 
 @dataclass
 class Certificate:
@@ -41,42 +87,176 @@ class Certificate:
             self.issued_at = datetime.now().isoformat()
 
 class CertificateService:
-    """Service for handling certificate operations"""
+    """Service for handling certificate operations backed by SQLite"""
+    
+    COLUMNS = ('id', 'name', 'course', 'date', 'issued_at')
     
-    def __init__(self, data_file: Path):
-        self.data_file = data_file
-        self._ensure_data_file()
+    def __init__(self, db_file: Path, legacy_file: Optional[Path] = None):
+        self.db_file = db_file
+        # One shared connection per process; the lock serialises access across threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_file), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # Parsed rows kept in memory; reloaded when another connection commits
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_name_course: Dict[tuple, Dict[str, Any]] = {}
+        # Serialized list and ETag for the JSON API, rebuilt lazily after changes
+        self._json: Optional[bytes] = None
+        self._etag: Optional[str] = None
+        self._data_version: Optional[int] = None
+        self._init_db()
+        if legacy_file is not None:
+            self._import_legacy_file(legacy_file)
     
-    def _ensure_data_file(self) -> None:
-        """Create data file if it doesn't exist"""
-        if not self.data_file.exists():
-            with open(self.data_file, 'w') as f:
-                json.dump([], f)
+    def _init_db(self) -> None:
+        """Create schema and indexes if they don't exist"""
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS certificates ("
+                "id TEXT PRIMARY KEY, name TEXT, course TEXT, date TEXT, issued_at TEXT)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_name_course "
+                "ON certificates(lower(name), lower(course))"
+            )
+    
+    def _import_legacy_file(self, legacy_file: Path) -> None:
+        """Import certificates from the old JSON store into an empty database"""
+        if not legacy_file.exists():
+            return
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM certificates LIMIT 1").fetchone():
+                return
+        try:
+            with open(legacy_file, 'rb') as f:
+                certificates = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, OSError) as e:
+            logger.error(f"Error reading legacy certificates file: {e}")
+            return
+        if not isinstance(certificates, list):
+            logger.error(f"Legacy certificates file {legacy_file} is not a JSON list, skipping import")
+            return
+        if not certificates:
+            return
+        
+        # The old store never enforced unique ids; keep the first row for each id
+        rows = [tuple(c.get(col) for col in self.COLUMNS)
+                for c in certificates if isinstance(c, dict) and c.get('id')]
+        try:
+            with self._lock:
+                with self._conn:
+                    imported = self._conn.executemany(
+                        "INSERT OR IGNORE INTO certificates (id, name, course, date, issued_at) VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    ).rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error importing legacy certificates: {e}")
+            return
+        
+        skipped = len(certificates) - imported
+        if skipped:
+            logger.warning(f"Skipped {skipped} invalid or duplicate certificates from {legacy_file}")
+        logger.info(f"Imported {imported} certificates from {legacy_file}")
+    
+    def _cache_is_current(self) -> bool:
+        """Check the cache against PRAGMA data_version (caller holds the lock)"""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._cache is not None and version == self._data_version:
+            return True
+        self._data_version = version
+        return False
+    
+    @staticmethod
+    def _name_course_key(name: Optional[str], course: Optional[str]) -> tuple:
+        """Case-insensitive lookup key for name/course searches"""
+        return ((name or '').lower(), (course or '').lower())
+    
+    def _set_cache(self, certificates: List[Dict[str, Any]]) -> None:
+        """Replace the cached rows and rebuild the lookup indexes"""
+        self._cache = []
+        self._json = None
+        self._etag = None
+        self._by_id = {}
+        self._by_name_course = {}
+        for cert in certificates:
+            self._append_cache(cert)
+    
+    def _append_cache(self, cert: Dict[str, Any]) -> None:
+        """Add one row to the cache and indexes (first match wins for name/course)"""
+        self._cache.append(cert)
+        self._json = None
+        self._by_id.setdefault(cert.get('id'), cert)
+        self._by_name_course.setdefault(self._name_course_key(cert.get('name'), cert.get('course')), cert)
+    
+    def _refresh_cache(self) -> None:
+        """Reload rows from the database if the cache is stale (caller holds the lock)"""
+        if self._cache_is_current():
+            return
+        rows = self._conn.execute(
+            "SELECT id, name, course, date, issued_at FROM certificates ORDER BY rowid"
+        ).fetchall()
+        self._set_cache([dict(row) for row in rows])
     
     def load_certificates(self) -> List[Dict[str, Any]]:
-        """Load all certificates from file"""
+        """Load all certificates in insertion order (shared cached list, do not mutate)"""
         try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            with self._lock:
+                self._refresh_cache()
+                return self._cache
+        except sqlite3.Error as e:
             logger.error(f"Error loading certificates: {e}")
             return []
     
+    def certificates_json(self) -> tuple:
+        """Return (body, etag) for all certificates, serialized once per change"""
+        try:
+            with self._lock:
+                self._refresh_cache()
+                if self._json is None:
+                    self._json = orjson.dumps(self._cache, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+                    self._etag = hashlib.blake2b(self._json, digest_size=16).hexdigest()
+                return self._json, self._etag
+        except sqlite3.Error as e:
+            logger.error(f"Error loading certificates: {e}")
+            return b'[]\n', None
+    
+    def count(self) -> int:
+        """Number of stored certificates, served from the cache"""
+        return len(self.load_certificates())
+    
     def save_certificates(self, certificates: List[Dict[str, Any]]) -> None:
-        """Save certificates to file"""
+        """Replace all stored certificates"""
+        rows = [tuple(c.get(col) for col in self.COLUMNS) for c in certificates]
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(certificates, f, indent=2, default=str)
-        except IOError as e:
+            with self._lock:
+                with self._conn:
+                    self._conn.execute("DELETE FROM certificates")
+                    self._conn.executemany(
+                        "INSERT INTO certificates (id, name, course, date, issued_at) VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+                # Own commits don't bump data_version, so refresh the cache directly
+                self._set_cache([dict(zip(self.COLUMNS, row)) for row in rows])
+        except sqlite3.Error as e:
             logger.error(f"Error saving certificates: {e}")
             raise
     
     def add_certificate(self, certificate: Certificate) -> bool:
         """Add a new certificate"""
         try:
-            certificates = self.load_certificates()
-            certificates.append(asdict(certificate))
-            self.save_certificates(certificates)
+            row = asdict(certificate)
+            with self._lock:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT INTO certificates (id, name, course, date, issued_at) "
+                        "VALUES (:id, :name, :course, :date, :issued_at)",
+                        row
+                    )
+                if self._cache is not None:
+                    self._append_cache(row)
             logger.info(f"Certificate {certificate.id} added for {certificate.name}")
             return True
         except Exception as e:
@@ -84,19 +264,61 @@ class CertificateService:
             return False
     
     def find_certificate(self, cert_id: str = None, name: str = None, course: str = None) -> Optional[Dict[str, Any]]:
-        """Find a certificate by ID, name, or course"""
-        certificates = self.load_certificates()
-        
-        if cert_id:
-            return next((c for c in certificates if c.get('id') == cert_id), None)
-        elif name and course:
-            return next((c for c in certificates 
-                        if c.get('name', '').lower() == name.lower() 
-                        and c.get('course', '').lower() == course.lower()), None)
-        return None
+        """Find a certificate by ID (case-insensitive), name, or course"""
+        cert_id = (cert_id or '').strip().upper()
+        try:
+            with self._lock:
+                self._refresh_cache()
+                if cert_id:
+                    return self._by_id.get(cert_id)
+                elif name and course:
+                    return self._by_name_course.get(self._name_course_key(name, course))
+            return None
+        except sqlite3.Error as e:
+            logger.error(f"Error finding certificate: {e}")
+            return None
+
+def preload_templates() -> None:
+    """Compile all templates at startup so the first request doesn't pay for it"""
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+preload_templates()
 
 # Initialize services
-cert_service = CertificateService(app.config['CERTIFICATES_FILE'])
+cert_service = CertificateService(app.config['DATABASE_FILE'], legacy_file=app.config['CERTIFICATES_FILE'])
+
+def get_certificates() -> List[Dict[str, Any]]:
+    """Load certificates once per request and reuse them via flask.g"""
+    if 'certificates' not in g:
+        g.certificates = cert_service.load_certificates()
+    return g.certificates
+
+# (epoch minute, formatted date); date boundaries always fall on a minute boundary
+_date_cache = [0, '']
+
+def today_str() -> str:
+    """Today's date as DD-MM-YYYY, formatted at most once per minute"""
+    minute = int(time.time()) // 60
+    if minute != _date_cache[0]:
+        _date_cache[:] = [minute, datetime.now().strftime("%d-%m-%Y")]
+    return _date_cache[1]
+
+def validate_certificate_input(name: str, course: str) -> Optional[str]:
+    """Return an error message for invalid (already stripped) input, or None"""
+    if not name or not course:
+        return 'Please fill in all required fields.'
+    if len(name) > 100 or len(course) > 200:
+        return 'Input too long. Please shorten your text.'
+    return None
+
+def certificates_response() -> Response:
+    """Cached JSON list of all certificates, honouring If-None-Match"""
+    body, etag = cert_service.certificates_json()
+    response = Response(body, mimetype='application/json')
+    if etag:
+        response.set_etag(etag)
+    return response.make_conditional(request)
 
 # Routes
 @app.route('/')
@@ -111,6 +333,13 @@ def courses():
 def internships():
     return render_template('internships.html')
 
+@app.before_request
+def limit_certificate_form_size():
+    """Reject oversized certificate forms before the body is parsed"""
+    if (request.endpoint == 'certificate' and request.method == 'POST'
+            and (request.content_length or 0) > app.config['CERTIFICATE_FORM_MAX_LENGTH']):
+        abort(413)
+
 @app.route('/certificate', methods=['GET', 'POST'])
 def certificate():
     if request.method == 'POST':
@@ -118,17 +347,14 @@ def certificate():
         course = request.form.get('course', '').strip()
         
         # Basic input validation
-        if not name or not course:
-            flash('Please fill in all required fields.', 'error')
-            return render_template('certificate.html')
-        
-        if len(name) > 100 or len(course) > 200:
-            flash('Input too long. Please shorten your text.', 'error')
+        error = validate_certificate_input(name, course)
+        if error:
+            flash(error, 'error')
             return render_template('certificate.html')
         
         # Generate certificate
-        cert_id = str(uuid.uuid4())[:8].upper()
-        date = datetime.now().strftime("%d-%m-%Y")
+        cert_id = secrets.token_hex(4).upper()
+        date = today_str()
         
         certificate_obj = Certificate(
             id=cert_id,
@@ -140,7 +366,7 @@ def certificate():
         # Save to database
         if cert_service.add_certificate(certificate_obj):
             flash(f'Certificate generated successfully! Your ID: {cert_id}', 'success')
-            # In a real app, you'd generate PDF here
+            # In a real app, you'd generate PDF here (import reportlab locally to keep startup fast)
             return redirect(url_for('certificate'))
         else:
             flash('Error saving certificate. Please try again.', 'error')
@@ -151,7 +377,7 @@ def certificate():
 def verify():
     result = None
     if request.method == 'POST':
-        cert_id = request.form.get('cert_id', '').strip().upper()
+        cert_id = request.form.get('cert_id', '').strip()
         name = request.form.get('name', '').strip()
         course = request.form.get('course', '').strip()
         
@@ -182,7 +408,7 @@ def verify():
 @app.route('/verify/<cert_id>')
 def verify_direct(cert_id):
     """Direct verification via URL"""
-    found = cert_service.find_certificate(cert_id=cert_id.upper())
+    found = cert_service.find_certificate(cert_id=cert_id)
     
     if not found:
         flash('Certificate not found.', 'error')
@@ -199,8 +425,7 @@ def verify_direct(cert_id):
 @app.route('/api/certificates')
 def api_certificates():
     """API endpoint to get all certificates (for demo)"""
-    certificates = cert_service.load_certificates()
-    return jsonify(certificates)
+    return certificates_response()
 
 @app.route('/health')
 def health():
@@ -208,7 +433,7 @@ def health():
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'certificates_count': len(cert_service.load_certificates())
+        'certificates_count': cert_service.count()
     })
 
 # Error handlers
@@ -221,49 +446,193 @@ def internal_error(error):
     logger.error(f"Server error: {error}")
     return render_template('500.html'), 500
 
-if __name__ == '__main__':
-    # Production configuration
-    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
-    host = os.environ.get('FLASK_HOST', '0.0.0.0')
-    port = int(os.environ.get('FLASK_PORT', 5000))
-    
-    app.run(host=host, port=port, debug=debug_mode)
-    
-    import hashlib
-from functools import wraps
+def hash_password(password):
+    """Hash password using SHA-256"""
+    return hashlib.sha256(password.encode()).hexdigest()
 
 # Admin credentials (in production, use database with hashed passwords)
+# Only the password hash is kept in memory, computed once at import
 ADMIN_CREDENTIALS = {
     'admin': {
-        'password': 'admin123',  # In production, use hashed passwords
+        'password_hash': hash_password('admin123'),
         'name': 'System Administrator',
         'email': 'admin@loidanalytics.com'
     }
 }
 
-def hash_password(password):
-    """Hash password using SHA-256"""
-    return hashlib.sha256(password.encode()).hexdigest()
- 
 
+# Endpoints under /admin/ that don't require a logged-in admin
+PUBLIC_ADMIN_ENDPOINTS = frozenset({'admin_login', 'admin_logout'})
+
+@app.before_request
+def require_admin_login():
+    """Redirect unauthenticated requests for admin pages to the login form"""
+    if (request.path.startswith('/admin/')
+            and request.endpoint not in PUBLIC_ADMIN_ENDPOINTS
+            and 'admin_logged_in' not in session):
+        flash('Please log in to access the admin panel.', 'error')
+        return redirect(url_for('admin_login'))
 
-def login_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if 'admin_logged_in' not in session:
-            flash('Please log in to access the admin panel.', 'error')
-            return redirect(url_for('admin_login'))
-        return f(*args, **kwargs)
-    return decorated_function
+# Static demo data for the admin dashboard, built once at import rather than per request
+# Recent activity demo data
+DEMO_RECENT_ACTIVITY = (
+    {
+        'time': '10:30 AM',
+        'date': 'Today',
+        'user': 'Alex Johnson',
+        'user_email': 'alex@example.com',
+        'type': 'Certificate Generation',
+        'type_icon': 'fas fa-certificate',
+        'type_color': 'bg-gradient-to-r from-primary-500 to-cyan-500',
+        'details': 'Generated certificate for Python Programming',
+        'certificate_id': 'LA-2024-ABC12',
+        'status': 'Completed',
+        'status_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400'
+    },
+    {
+        'time': '09:15 AM',
+        'date': 'Today',
+        'user': 'Sarah Miller',
+        'user_email': 'sarah@example.com',
+        'type': 'Certificate Verification',
+        'type_icon': 'fas fa-shield-alt',
+        'type_color': 'bg-gradient-to-r from-green-500 to-emerald-500',
+        'details': 'Verified certificate authenticity',
+        'certificate_id': 'LA-2024-XYZ34',
+        'status': 'Verified',
+        'status_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400'
+    },
+    {
+        'time': 'Yesterday',
+        'date': '3:45 PM',
+        'user': 'Michael Chen',
+        'user_email': 'michael@example.com',
+        'type': 'Course Enrollment',
+        'type_icon': 'fas fa-graduation-cap',
+        'type_color': 'bg-gradient-to-r from-purple-500 to-pink-500',
+        'details': 'Enrolled in Machine Learning Fundamentals',
+        'certificate_id': None,
+        'status': 'Completed',
+        'status_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400'
+    }
+)
+
+# Demo courses data
+DEMO_COURSES = (
+    {
+        'id': 1,
+        'name': 'Python Programming Mastery',
+        'category': 'Programming',
+        'difficulty': 'Beginner',
+        'difficulty_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400',
+        'description': 'Master Python from basics to advanced concepts.',
+        'enrollments': 1250,
+        'price': 89,
+        'gradient': 'from-blue-500 to-cyan-500'
+    },
+    {
+        'id': 2,
+        'name': 'Machine Learning Fundamentals',
+        'category': 'AI/ML',
+        'difficulty': 'Intermediate',
+        'difficulty_color': 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900/30 dark:text-yellow-400',
+        'description': 'Learn ML algorithms and practical implementations.',
+        'enrollments': 890,
+        'price': 149,
+        'gradient': 'from-purple-500 to-pink-500'
+    },
+    {
+        'id': 3,
+        'name': 'Data Science & Analytics',
+        'category': 'Analytics',
+        'difficulty': 'Intermediate',
+        'difficulty_color': 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900/30 dark:text-yellow-400',
+        'description': 'Complete data analysis and visualization course.',
+        'enrollments': 720,
+        'price': 129,
+        'gradient': 'from-green-500 to-teal-500'
+    }
+)
+
+# Demo internships data
+DEMO_INTERNSHIPS = (
+    {
+        'id': 1,
+        'position': 'Python Development Intern',
+        'company': 'TechCorp Solutions',
+        'location': 'Remote',
+        'type': 'Remote',
+        'type_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400',
+        'description': 'Build and maintain Python applications and APIs.',
+        'skills': ('Python', 'APIs', 'Backend'),
+        'duration': '3-6 months',
+        'stipend': '$2,500/month',
+        'applications': 45
+    },
+    {
+        'id': 2,
+        'position': 'Machine Learning Intern',
+        'company': 'AI Innovations Inc.',
+        'location': 'San Francisco, CA',
+        'type': 'On-site',
+        'type_color': 'bg-blue-100 text-blue-800 dark:bg-blue-900/30 dark:text-blue-400',
+        'description': 'Develop ML models and work with large datasets.',
+        'skills': ('ML', 'TensorFlow', 'Neural Networks'),
+        'duration': '4-8 months',
+        'stipend': '$3,000/month',
+        'applications': 68
+    }
+)
+
+# Demo users data
+DEMO_USERS = (
+    {
+        'id': 'USR001',
+        'name': 'Alex Johnson',
+        'email': 'alex@example.com',
+        'phone': '+1 (555) 123-4567',
+        'role': 'Student',
+        'role_color': 'bg-blue-100 text-blue-800 dark:bg-blue-900/30 dark:text-blue-400',
+        'joined_date': '2024-01-15',
+        'certificates_count': 2,
+        'status': 'active'
+    },
+    {
+        'id': 'USR002',
+        'name': 'Sarah Miller',
+        'email': 'sarah@example.com',
+        'phone': '+1 (555) 987-6543',
+        'role': 'Instructor',
+        'role_color': 'bg-purple-100 text-purple-800 dark:bg-purple-900/30 dark:text-purple-400',
+        'joined_date': '2024-02-20',
+        'certificates_count': 5,
+        'status': 'active'
+    }
+)
+
+# Demo chart data for the statistics API
+DEMO_MONTHLY_GROWTH = {
+    'labels': ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'),
+    'certificates': (65, 78, 90, 85, 120, 150, 180, 200, 220, 240, 260, 280)
+}
+
+DEMO_POPULAR_COURSES = (
+    {'name': 'Python', 'value': 35},
+    {'name': 'ML', 'value': 25},
+    {'name': 'Data Science', 'value': 20},
+    {'name': 'Deep Learning', 'value': 15},
+    {'name': 'Business Analytics', 'value': 5}
+)
 
 # Admin Routes
 @app.route('/admin/login', methods=['GET', 'POST'])
 def admin_login():
     if request.method == 'POST':
         username = request.form.get('username')
-        password = request.form.get('password')
+        password = request.form.get('password', '')
         
-        if username in ADMIN_CREDENTIALS and password == ADMIN_CREDENTIALS[username]['password']:
+        admin = ADMIN_CREDENTIALS.get(username)
+        if admin and hmac.compare_digest(hash_password(password), admin['password_hash']):
             session['admin_logged_in'] = True
             session['admin_username'] = username
             session['admin_name'] = ADMIN_CREDENTIALS[username]['name']
@@ -281,184 +650,48 @@ def admin_logout():
     return redirect(url_for('admin_login'))
 
 @app.route('/admin/dashboard')
-@login_required
 def admin_dashboard():
     # Get statistics
-    certificates = cert_service.load_certificates()
+    certificates = get_certificates()
+    total_certificates = len(certificates)
     
     # Generate demo data for the dashboard
     stats = {
-        'total_certificates': len(certificates),
+        'total_certificates': total_certificates,
         'certificates_growth': 15,  # demo data
         'total_courses': 6,
         'courses_growth': 8,
         'total_internships': 6,
         'internships_growth': 12,
         'verification_rate': 99.8,
-        'total_verifications': len(certificates) * 3  # demo data
+        'total_verifications': total_certificates * 3  # demo data
     }
     
-    # Recent activity demo data
-    recent_activity = [
-        {
-            'time': '10:30 AM',
-            'date': 'Today',
-            'user': 'Alex Johnson',
-            'user_email': 'alex@example.com',
-            'type': 'Certificate Generation',
-            'type_icon': 'fas fa-certificate',
-            'type_color': 'bg-gradient-to-r from-primary-500 to-cyan-500',
-            'details': 'Generated certificate for Python Programming',
-            'certificate_id': 'LA-2024-ABC12',
-            'status': 'Completed',
-            'status_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400'
-        },
-        {
-            'time': '09:15 AM',
-            'date': 'Today',
-            'user': 'Sarah Miller',
-            'user_email': 'sarah@example.com',
-            'type': 'Certificate Verification',
-            'type_icon': 'fas fa-shield-alt',
-            'type_color': 'bg-gradient-to-r from-green-500 to-emerald-500',
-            'details': 'Verified certificate authenticity',
-            'certificate_id': 'LA-2024-XYZ34',
-            'status': 'Verified',
-            'status_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400'
-        },
-        {
-            'time': 'Yesterday',
-            'date': '3:45 PM',
-            'user': 'Michael Chen',
-            'user_email': 'michael@example.com',
-            'type': 'Course Enrollment',
-            'type_icon': 'fas fa-graduation-cap',
-            'type_color': 'bg-gradient-to-r from-purple-500 to-pink-500',
-            'details': 'Enrolled in Machine Learning Fundamentals',
-            'certificate_id': None,
-            'status': 'Completed',
-            'status_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400'
-        }
-    ]
-    
     # Enhanced certificate data for admin
-    enhanced_certificates = []
-    for cert in certificates[-10:]:  # Show last 10 certificates
-        enhanced_cert = cert.copy()
-        enhanced_cert['status'] = 'active'
-        enhanced_cert['verified_count'] = 3  # demo data
-        enhanced_cert['email'] = 'user@example.com'  # demo data
-        enhanced_cert['type'] = 'Course' if 'internship' not in cert['course'].lower() else 'Internship'
-        enhanced_certificates.append(enhanced_cert)
-    
-    # Demo courses data
-    courses = [
-        {
-            'id': 1,
-            'name': 'Python Programming Mastery',
-            'category': 'Programming',
-            'difficulty': 'Beginner',
-            'difficulty_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400',
-            'description': 'Master Python from basics to advanced concepts.',
-            'enrollments': 1250,
-            'price': 89,
-            'gradient': 'from-blue-500 to-cyan-500'
-        },
+    enhanced_certificates = [
         {
-            'id': 2,
-            'name': 'Machine Learning Fundamentals',
-            'category': 'AI/ML',
-            'difficulty': 'Intermediate',
-            'difficulty_color': 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900/30 dark:text-yellow-400',
-            'description': 'Learn ML algorithms and practical implementations.',
-            'enrollments': 890,
-            'price': 149,
-            'gradient': 'from-purple-500 to-pink-500'
-        },
-        {
-            'id': 3,
-            'name': 'Data Science & Analytics',
-            'category': 'Analytics',
-            'difficulty': 'Intermediate',
-            'difficulty_color': 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900/30 dark:text-yellow-400',
-            'description': 'Complete data analysis and visualization course.',
-            'enrollments': 720,
-            'price': 129,
-            'gradient': 'from-green-500 to-teal-500'
-        }
-    ]
-    
-    # Demo internships data
-    internships = [
-        {
-            'id': 1,
-            'position': 'Python Development Intern',
-            'company': 'TechCorp Solutions',
-            'location': 'Remote',
-            'type': 'Remote',
-            'type_color': 'bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-400',
-            'description': 'Build and maintain Python applications and APIs.',
-            'skills': ['Python', 'APIs', 'Backend'],
-            'duration': '3-6 months',
-            'stipend': '$2,500/month',
-            'applications': 45
-        },
-        {
-            'id': 2,
-            'position': 'Machine Learning Intern',
-            'company': 'AI Innovations Inc.',
-            'location': 'San Francisco, CA',
-            'type': 'On-site',
-            'type_color': 'bg-blue-100 text-blue-800 dark:bg-blue-900/30 dark:text-blue-400',
-            'description': 'Develop ML models and work with large datasets.',
-            'skills': ['ML', 'TensorFlow', 'Neural Networks'],
-            'duration': '4-8 months',
-            'stipend': '$3,000/month',
-            'applications': 68
-        }
-    ]
-    
-    # Demo users data
-    users = [
-        {
-            'id': 'USR001',
-            'name': 'Alex Johnson',
-            'email': 'alex@example.com',
-            'phone': '+1 (555) 123-4567',
-            'role': 'Student',
-            'role_color': 'bg-blue-100 text-blue-800 dark:bg-blue-900/30 dark:text-blue-400',
-            'joined_date': '2024-01-15',
-            'certificates_count': 2,
-            'status': 'active'
-        },
-        {
-            'id': 'USR002',
-            'name': 'Sarah Miller',
-            'email': 'sarah@example.com',
-            'phone': '+1 (555) 987-6543',
-            'role': 'Instructor',
-            'role_color': 'bg-purple-100 text-purple-800 dark:bg-purple-900/30 dark:text-purple-400',
-            'joined_date': '2024-02-20',
-            'certificates_count': 5,
-            'status': 'active'
+            **cert,
+            'status': 'active',
+            'verified_count': 3,  # demo data
+            'email': 'user@example.com',  # demo data
+            'type': 'Internship' if 'internship' in cert['course'].lower() else 'Course'
         }
+        for cert in certificates[-10:]  # Show last 10 certificates
     ]
     
     return render_template('admin.html',
                          stats=stats,
-                         recent_activity=recent_activity,
+                         recent_activity=DEMO_RECENT_ACTIVITY,
                          certificates=enhanced_certificates,
-                         courses=courses,
-                         internships=internships,
-                         users=users)
+                         courses=DEMO_COURSES,
+                         internships=DEMO_INTERNSHIPS,
+                         users=DEMO_USERS)
 
 # Admin API endpoints
 @app.route('/admin/api/certificates', methods=['GET', 'POST', 'DELETE'])
-@login_required
 def admin_api_certificates():
     if request.method == 'GET':
-        certificates = cert_service.load_certificates()
-        return jsonify(certificates)
+        return certificates_response()
     
     elif request.method == 'POST':
         data = request.json
@@ -471,30 +704,19 @@ def admin_api_certificates():
         return jsonify({'status': 'success', 'message': 'Certificate deleted'})
 
 @app.route('/admin/api/statistics')
-@login_required
 def admin_api_statistics():
-    certificates = cert_service.load_certificates()
-    
-    # Calculate monthly growth
-    monthly_data = {
-        'labels': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
-        'certificates': [65, 78, 90, 85, 120, 150, 180, 200, 220, 240, 260, 280]
-    }
-    
     return jsonify({
-        'total_certificates': len(certificates),
-        'monthly_growth': monthly_data,
-        'popular_courses': [
-            {'name': 'Python', 'value': 35},
-            {'name': 'ML', 'value': 25},
-            {'name': 'Data Science', 'value': 20},
-            {'name': 'Deep Learning', 'value': 15},
-            {'name': 'Business Analytics', 'value': 5}
-        ]
+        'total_certificates': cert_service.count(),
+        'monthly_growth': DEMO_MONTHLY_GROWTH,
+        'popular_courses': DEMO_POPULAR_COURSES
     })
-    import os
 
 ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'secure-password-here')
 
-
-
+if __name__ == '__main__':
+    # Development server; in production run under gunicorn (see gunicorn.conf.py)
+    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    host = os.environ.get('FLASK_HOST', '0.0.0.0')
+    port = int(os.environ.get('FLASK_PORT', 5000))
+    
+    app.run(host=host, port=port, debug=debug_mode)
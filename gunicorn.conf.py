@@ -0,0 +1,14 @@
+# Gunicorn settings for production: gunicorn app:app
+import multiprocessing
+import os
+
+bind = f"{os.environ.get('FLASK_HOST', '0.0.0.0')}:{os.environ.get('PORT', os.environ.get('FLASK_PORT', '5000'))}"
+
+# One process per core; each opens its own SQLite connection after fork,
+# so the app must not be preloaded in the master
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+preload_app = False
+
+# Threads rather than gevent: SQLite calls block in C and would stall a greenlet hub
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))